@@ -9,13 +9,16 @@ import os
 import math
 import re
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
+from tkinter import ttk, scrolledtext, messagebox, font as tkfont
 from datetime import datetime
 from typing import List, Dict, Optional
 
 
 # ==================== BACKEND LAYER ====================
 
+# Characters an expression may contain once its functions are rewritten
+EXPRESSION_CHARS = re.compile(r'^[0-9+\-*/().mathlrsgincoepi\s]+$')
+
 class CalculationEngine:
     """Backend calculation engine with advanced operations"""
     
@@ -33,7 +36,7 @@ class CalculationEngine:
         expr = expr.replace("π", "math.pi")
         expr = expr.replace("e", "math.e")
         
-        if not re.match(r'^[0-9+\-*/().mathlrsgincoepi\s]+$', expr):
+        if not EXPRESSION_CHARS.match(expr):
             raise ValueError("Invalid characters in expression")
         
         try:
@@ -70,14 +73,16 @@ class HistoryManager:
         except Exception as e:
             print(f"Warning: Could not save history: {e}")
     
-    def add_entry(self, operation: str, result: float) -> None:
+    def add_entry(self, operation: str, result: float, save: bool = True) -> None:
         entry = {
             "timestamp": datetime.now().isoformat(),
             "operation": operation,
             "result": result
         }
         self.history.append(entry)
-        self.save_history()
+        # Callers that batch writes pass save=False and call save_history()
+        if save:
+            self.save_history()
     
     def get_history(self, limit: Optional[int] = None) -> List[Dict]:
         if limit:
@@ -85,6 +90,9 @@ class HistoryManager:
         return self.history
     
     def clear_history(self) -> None:
+        # Nothing to rewrite when there is no history to clear
+        if not self.history:
+            return
         self.history = []
         self.save_history()
     
@@ -176,6 +184,32 @@ class ModernButton(tk.Canvas):
 class CalculatorGUI:
     """Modern premium GUI interface"""
     
+    # Expression text appended by keys whose label differs from their token
+    INPUT_TOKENS = {
+        '÷': '/',
+        '×': '*',
+        'x²': '**2',
+        '√': 'sqrt(',
+        'sin': 'sin(',
+        'cos': 'cos(',
+        'tan': 'tan(',
+        'π': 'pi'
+    }
+    
+    # Placeholder shown in the history tab, as insert() text/tag pairs
+    EMPTY_HISTORY_TEXT = (
+        "\n\n        No calculations yet\n\n    Start calculating to see\n", (),
+        "        your history here!", 'center'
+    )
+    
+    # Hover colour for each keypad base colour
+    HOVER_COLORS = {
+        '#1a1a1a': '#2a2a2a',
+        '#2a2a2a': '#3a3a3a',
+        '#ff3366': '#ff4477',
+        '#00d4ff': '#33ddff'
+    }
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Calculator")
@@ -189,9 +223,28 @@ class CalculatorGUI:
         self.history_manager = HistoryManager()
         self.memory: Optional[float] = None
         self.current_theme = "dark"
+        self.toast: Optional[tk.Toplevel] = None
+        self.toast_hide_job: Optional[str] = None
+        # New history entries are written to disk from an idle callback, so
+        # the result shows first and quick successive calculations share a write
+        self.history_save_job: Optional[str] = None
+        # The history listing is only rendered while its tab is showing;
+        # changes made from the calculator tab mark it for the next view
+        self.history_stale = True
+        # Keys that run a command instead of appending to the expression,
+        # looked up once per click instead of walking an if/elif chain
+        self.command_keys = {
+            'C': self.clear_expression,
+            '⌫': self.backspace,
+            '=': self.calculate,
+            '±': self.toggle_sign,
+            'MC': self.memory_clear,
+            'MR': self.memory_recall,
+            'MS': self.memory_store,
+            'M+': self.memory_add
+        }
         
         self.setup_ui()
-        self.update_history_display()
     
     def setup_ui(self):
         """Setup the modern user interface"""
@@ -306,19 +359,20 @@ class CalculatorGUI:
                  background=[('selected', '#00d4ff')],
                  foreground=[('selected', '#000000')])
         
-        notebook = ttk.Notebook(main_frame, style='Modern.TNotebook')
-        notebook.pack(fill=tk.BOTH, expand=True)
+        self.notebook = ttk.Notebook(main_frame, style='Modern.TNotebook')
+        self.notebook.pack(fill=tk.BOTH, expand=True)
         
         # Calculator tab
-        calc_tab = tk.Frame(notebook, bg="#0f0f0f")
-        notebook.add(calc_tab, text="CALCULATOR")
+        calc_tab = tk.Frame(self.notebook, bg="#0f0f0f")
+        self.notebook.add(calc_tab, text="CALCULATOR")
         
         # History tab
-        history_tab = tk.Frame(notebook, bg="#0f0f0f")
-        notebook.add(history_tab, text="HISTORY")
+        self.history_tab = tk.Frame(self.notebook, bg="#0f0f0f")
+        self.notebook.add(self.history_tab, text="HISTORY")
         
         self.setup_calculator_tab(calc_tab)
-        self.setup_history_tab(history_tab)
+        self.setup_history_tab(self.history_tab)
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
     
     def setup_calculator_tab(self, parent):
         """Setup modern calculator buttons"""
@@ -377,12 +431,16 @@ class CalculatorGUI:
             ]
         ]
         
+        # One named font shared by every keypad button instead of a font
+        # description resolved per button; kept on self so Tk keeps it alive
+        self.button_font = tkfont.Font(family="Segoe UI", size=13, weight="bold")
+        
         for i, row in enumerate(buttons):
             for j, btn_config in enumerate(row):
                 btn = tk.Button(
                     button_frame,
                     text=btn_config['text'],
-                    font=("Segoe UI", 13, "bold"),
+                    font=self.button_font,
                     bg=btn_config['bg'],
                     fg=btn_config['fg'],
                     activebackground=btn_config['bg'],
@@ -394,9 +452,9 @@ class CalculatorGUI:
                 )
                 btn.grid(row=i, column=j, sticky="nsew", padx=3, pady=3)
                 
-                # Hover effect
-                btn.bind("<Enter>", lambda e, b=btn: b.config(bg=self.lighten_color(b['bg'])))
-                btn.bind("<Leave>", lambda e, b=btn, c=btn_config['bg']: b.config(bg=c))
+                # Hover effect (shared handlers, no per-button closures)
+                btn.bind("<Enter>", self.on_button_enter)
+                btn.bind("<Leave>", self.on_button_leave)
         
         # Configure grid weights
         for i in range(len(buttons)):
@@ -404,15 +462,18 @@ class CalculatorGUI:
         for j in range(4):
             button_frame.grid_columnconfigure(j, weight=1)
     
+    def on_button_enter(self, event):
+        """Highlight the hovered keypad button"""
+        # activebackground holds the button's base colour
+        event.widget.config(bg=self.lighten_color(event.widget['activebackground']))
+    
+    def on_button_leave(self, event):
+        """Restore the keypad button's base colour"""
+        event.widget.config(bg=event.widget['activebackground'])
+    
     def lighten_color(self, color):
         """Lighten a color for hover effect"""
-        color_map = {
-            '#1a1a1a': '#2a2a2a',
-            '#2a2a2a': '#3a3a3a',
-            '#ff3366': '#ff4477',
-            '#00d4ff': '#33ddff'
-        }
-        return color_map.get(color, color)
+        return self.HOVER_COLORS.get(color, color)
     
     def setup_history_tab(self, parent):
         """Setup modern history display"""
@@ -471,76 +532,67 @@ class CalculatorGUI:
     
     def on_button_click(self, button_text):
         """Handle button clicks with animations"""
+        command = self.command_keys.get(button_text)
+        if command is not None:
+            command()
+        else:
+            # Every other key appends to the expression, mapped to its token
+            self.expression_var.set(
+                self.expression_var.get() + self.INPUT_TOKENS.get(button_text, button_text)
+            )
+    
+    def clear_expression(self):
+        """Clear the expression and result"""
+        self.expression_var.set('')
+        self.result_var.set('0')
+        self.animate_display()
+    
+    def backspace(self):
+        """Remove the last character of the expression"""
+        self.expression_var.set(self.expression_var.get()[:-1])
+    
+    def toggle_sign(self):
+        """Negate the expression, or drop its leading minus"""
         current = self.expression_var.get()
-        
-        if button_text == 'C':
-            self.expression_var.set('')
-            self.result_var.set('0')
-            self.animate_display()
-        
-        elif button_text == '⌫':
-            self.expression_var.set(current[:-1])
-        
-        elif button_text == '=':
-            self.calculate()
-        
-        elif button_text == '±':
-            if current and current != '0':
-                if current.startswith('-'):
-                    self.expression_var.set(current[1:])
-                else:
-                    self.expression_var.set('-' + current)
-        
-        elif button_text == 'MC':
-            self.memory = None
-            self.memory_indicator.config(text="")
-            self.show_toast("Memory cleared")
-        
-        elif button_text == 'MR':
-            if self.memory is not None:
-                self.expression_var.set(str(self.memory))
+        if current and current != '0':
+            if current.startswith('-'):
+                self.expression_var.set(current[1:])
             else:
-                self.show_toast("Memory is empty")
-        
-        elif button_text == 'MS':
+                self.expression_var.set('-' + current)
+    
+    def memory_clear(self):
+        """Clear the stored memory value"""
+        self.memory = None
+        self.memory_indicator.config(text="")
+        self.show_toast("Memory cleared")
+    
+    def memory_recall(self):
+        """Put the stored memory value into the expression"""
+        if self.memory is not None:
+            self.expression_var.set(str(self.memory))
+        else:
+            self.show_toast("Memory is empty")
+    
+    def memory_store(self):
+        """Store the current result in memory"""
+        try:
+            result = self.result_var.get()
+            if result != '0':
+                self.memory = float(result)
+                self.memory_indicator.config(text=f"💾 M = {self.memory}")
+                self.show_toast(f"Stored: {self.memory}")
+        except:
+            self.show_toast("No valid result to store")
+    
+    def memory_add(self):
+        """Add the current result to the stored memory value"""
+        if self.memory is not None:
             try:
-                result = self.result_var.get()
-                if result != '0':
-                    self.memory = float(result)
-                    self.memory_indicator.config(text=f"💾 M = {self.memory}")
-                    self.show_toast(f"Stored: {self.memory}")
+                result = float(self.result_var.get())
+                self.memory += result
+                self.memory_indicator.config(text=f"💾 M = {self.memory}")
             except:
-                self.show_toast("No valid result to store")
-        
-        elif button_text == 'M+':
-            if self.memory is not None:
-                try:
-                    result = float(self.result_var.get())
-                    self.memory += result
-                    self.memory_indicator.config(text=f"💾 M = {self.memory}")
-                except:
-                    pass
-        
-        elif button_text == '÷':
-            self.expression_var.set(current + '/')
-        
-        elif button_text == '×':
-            self.expression_var.set(current + '*')
-        
-        elif button_text == 'x²':
-            self.expression_var.set(current + '**2')
-        
-        elif button_text == '√':
-            self.expression_var.set(current + 'sqrt(')
-        
-        elif button_text in ['sin', 'cos', 'tan']:
-            self.expression_var.set(current + button_text + '(')
-        
-        elif button_text == 'π':
-            self.expression_var.set(current + 'pi')
-        
-        else:
-            self.expression_var.set(current + button_text)
+                pass
     
     def calculate(self):
         """Perform calculation with animation"""
@@ -552,8 +604,9 @@ class CalculatorGUI:
         try:
             result = self.engine.evaluate_expression(expression)
             self.result_var.set(str(result))
-            self.history_manager.add_entry(expression, result)
-            self.update_history_display()
+            self.history_manager.add_entry(expression, result, save=False)
+            self.schedule_history_save()
+            self.refresh_history_display()
             self.animate_result()
             
             # Update history indicator
@@ -564,6 +617,17 @@ class CalculatorGUI:
             self.result_var.set("Error")
             self.show_toast(str(e))
     
+    def schedule_history_save(self):
+        """Write the history file once pending UI updates have run"""
+        if self.history_save_job is None:
+            self.history_save_job = self.root.after_idle(self.flush_history_save)
+    
+    def flush_history_save(self):
+        """Write the history file if a deferred save is pending"""
+        if self.history_save_job is not None:
+            self.history_save_job = None
+            self.history_manager.save_history()
+    
     def animate_display(self):
         """Simple animation effect"""
         pass
@@ -574,20 +638,28 @@ class CalculatorGUI:
     
     def show_toast(self, message):
         """Show a modern toast notification"""
-        toast = tk.Toplevel(self.root)
-        toast.overrideredirect(True)
-        toast.configure(bg="#1a1a1a")
-        
-        label = tk.Label(
-            toast,
-            text=message,
-            font=("Segoe UI", 10),
-            bg="#1a1a1a",
-            fg="#ffffff",
-            padx=20,
-            pady=10
-        )
-        label.pack()
+        # One toast window is created lazily and reused; a new message
+        # replaces the current one and restarts its hide timer
+        if self.toast is None:
+            self.toast = tk.Toplevel(self.root)
+            self.toast.overrideredirect(True)
+            self.toast.configure(bg="#1a1a1a")
+            
+            self.toast_label = tk.Label(
+                self.toast,
+                font=("Segoe UI", 10),
+                bg="#1a1a1a",
+                fg="#ffffff",
+                padx=20,
+                pady=10
+            )
+            self.toast_label.pack()
+        elif self.toast_hide_job is not None:
+            self.toast.after_cancel(self.toast_hide_job)
+        
+        toast = self.toast
+        self.toast_label.config(text=message)
+        toast.deiconify()
         
         # Position at bottom center
         toast.update_idletasks()
@@ -595,13 +667,34 @@ class CalculatorGUI:
         y = self.root.winfo_y() + self.root.winfo_height() - 100
         toast.geometry(f"+{x}+{y}")
         
-        # Auto close after 2 seconds
-        toast.after(2000, toast.destroy)
+        # Auto hide after 2 seconds
+        self.toast_hide_job = toast.after(2000, self.hide_toast)
+    
+    def hide_toast(self):
+        """Hide the toast window until the next notification"""
+        self.toast_hide_job = None
+        self.toast.withdraw()
     
     def toggle_theme(self):
         """Toggle between dark and light themes"""
         self.show_toast("Theme toggle coming soon!")
     
+    def history_tab_visible(self):
+        """Check whether the history tab is the selected notebook tab"""
+        return self.notebook.select() == str(self.history_tab)
+    
+    def on_tab_changed(self, event):
+        """Render the history listing if it changed while hidden"""
+        if self.history_stale and self.history_tab_visible():
+            self.update_history_display()
+    
+    def refresh_history_display(self):
+        """Re-render the history now if it is showing, otherwise on next view"""
+        if self.history_tab_visible():
+            self.update_history_display()
+        else:
+            self.history_stale = True
+    
     def update_history_display(self):
         """Update the history display with modern styling"""
         history = self.history_manager.get_history(30)
@@ -610,20 +703,27 @@ class CalculatorGUI:
         self.history_text.delete(1.0, tk.END)
         
         if not history:
-            self.history_text.insert(tk.END, "\n\n")
-            self.history_text.insert(tk.END, "        No calculations yet\n\n")
-            self.history_text.insert(tk.END, "    Start calculating to see\n")
-            self.history_text.insert(tk.END, "        your history here!", 'center')
+            # One insert call carries both text runs; only the last is tagged
+            self.history_text.insert(tk.END, *self.EMPTY_HISTORY_TEXT)
         else:
-            for i, entry in enumerate(reversed(history), 1):
-                timestamp = datetime.fromisoformat(entry["timestamp"]).strftime("%H:%M:%S")
+            # Build the whole listing first and insert it into the widget once
+            parts = []
+            for entry in reversed(history):
+                # Timestamps are stored by datetime.isoformat(), so the
+                # HH:MM:SS part can be sliced out without parsing
+                timestamp = entry["timestamp"][11:19]
                 
-                self.history_text.insert(tk.END, f"\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
-                self.history_text.insert(tk.END, f"  ⏱️  {timestamp}\n")
-                self.history_text.insert(tk.END, f"  📝 {entry['operation']}\n")
-                self.history_text.insert(tk.END, f"  ✓  {entry['result']}\n")
+                parts.append(
+                    "\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+                    f"  ⏱️  {timestamp}\n"
+                    f"  📝 {entry['operation']}\n"
+                    f"  ✓  {entry['result']}\n"
+                )
+            
+            self.history_text.insert(tk.END, "".join(parts))
         
         self.history_text.config(state='disabled')
+        self.history_stale = False
     
     def clear_history(self):
         """Clear calculation history with confirmation"""
@@ -631,7 +731,7 @@ class CalculatorGUI:
                               "Are you sure you want to clear all history?",
                               icon='warning'):
             self.history_manager.clear_history()
-            self.update_history_display()
+            self.refresh_history_display()
             self.history_indicator.config(text="")
             self.show_toast("History cleared successfully")
 
@@ -650,6 +750,8 @@ def main():
     
     app = CalculatorGUI(root)
     root.mainloop()
+    # Don't lose an entry whose idle-time save never got to run
+    app.flush_history_save()
 
 
 if __name__ == "__main__":
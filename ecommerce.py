@@ -5,19 +5,233 @@ Author: Senior Full-Stack Developer
 Version: 1.0.0
 """
 
+import os
 import sys
+import logging
 import sqlite3
-import json
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QLineEdit, QFrame, QScrollArea, QGridLayout,
-    QProgressBar, QTableWidget, QTableWidgetItem
+    QLabel, QPushButton, QLineEdit, QFrame, QScrollArea,
+    QProgressBar, QTableView, QHeaderView
 )
-from PyQt6.QtCore import Qt, QTimer, QSize, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QFont, QIcon, QPalette, QColor, QPainter, QPen
-from PyQt6.QtCharts import QChart, QChartView, QLineSeries, QPieSeries, QBarSeries, QBarSet, QValueAxis, QBarCategoryAxis
-import random
+from PyQt6.QtCore import (
+    Qt, QTimer, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool,
+    QPointF, pyqtSignal
+)
+from PyQt6.QtGui import QFont, QColor, QPainter, QPen, QBrush, QStaticText
+from PyQt6.QtCharts import QChart, QChartView, QLineSeries, QPieSeries, QValueAxis
+
+
+logger = logging.getLogger(__name__)
+
+# Application-wide stylesheet, installed once on the QApplication. The window
+# background, sidebar, header, section cards/titles and the widgets repeated
+# in each section's rows are matched by object name instead of a stylesheet
+# set on each widget. Cards and the header keep styling all their
+# descendants, as their old unscoped sheets did; rules for widgets inside
+# them come later so they win ties in specificity.
+APP_STYLE = """
+    QMainWindow, QMainWindow * {
+        background-color: #f5f5f5;
+    }
+    QScrollArea#content {
+        border: none;
+    }
+    QFrame#sidebar, QFrame#sidebar QFrame {
+        background-color: #1a1a2e;
+        color: white;
+    }
+    QFrame#sidebar QPushButton {
+        text-align: left;
+        padding: 15px 20px;
+        border: none;
+        color: #b4b4b4;
+        font-size: 14px;
+        background-color: transparent;
+    }
+    QFrame#sidebar QPushButton:hover {
+        background-color: #252542;
+        color: white;
+    }
+    QFrame#sidebar QPushButton#active {
+        background-color: #FF8C00;
+        color: white;
+        border-radius: 10px;
+        margin: 0 10px;
+    }
+    QFrame#header, QFrame#header * {
+        background-color: white;
+        border-radius: 12px;
+        padding: 15px;
+    }
+    QLineEdit#search {
+        padding: 10px 15px;
+        border: 1px solid #e0e0e0;
+        border-radius: 8px;
+        font-size: 14px;
+        background-color: #f9f9f9;
+    }
+    QPushButton#notifications {
+        background-color: #f9f9f9;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 15px;
+        font-size: 18px;
+    }
+    QPushButton#notifications:hover {
+        background-color: #e0e0e0;
+    }
+    QFrame#card, QFrame#card * {
+        background-color: white;
+        border-radius: 12px;
+        padding: 20px;
+    }
+    QLabel#sectionTitle {
+        font-size: 18px;
+        font-weight: bold;
+        color: #333;
+    }
+    QLabel#countryName {
+        font-size: 13px;
+        color: #333;
+    }
+    QLabel#countryPercent {
+        font-size: 12px;
+        color: #666;
+    }
+    QProgressBar#countryProgress {
+        border: none;
+        border-radius: 4px;
+        background-color: #f0f0f0;
+        height: 8px;
+    }
+    QProgressBar#countryProgress::chunk {
+        background-color: #FF8C00;
+        border-radius: 4px;
+    }
+    QFrame#conversionStep, QFrame#conversionStep QLabel {
+        background-color: #f9f9f9;
+        border-radius: 8px;
+        padding: 15px;
+    }
+    QLabel#stepName {
+        font-size: 11px;
+        color: #666;
+    }
+    QLabel#stepValue {
+        font-size: 18px;
+        font-weight: bold;
+        color: #333;
+    }
+    QLabel#stepChange {
+        font-size: 11px;
+        color: #ef4444;
+        font-weight: 600;
+    }
+    QLabel#stepChange[positive="true"] {
+        color: #22c55e;
+    }
+    QLabel#legendSource {
+        font-size: 12px;
+        color: #666;
+    }
+    QLabel#legendPercent {
+        font-size: 12px;
+        font-weight: bold;
+        color: #333;
+    }
+    QTableView#inventory {
+        border: none;
+        gridline-color: #e0e0e0;
+        font-size: 13px;
+    }
+    QTableView#inventory::item {
+        padding: 8px;
+    }
+    QTableView#inventory QHeaderView::section {
+        background-color: #f5f5f5;
+        padding: 10px;
+        border: none;
+        font-weight: bold;
+        color: #666;
+    }
+"""
+
+# Metric cards as (metrics key, title, change, is_positive), plus the format
+# used to display each metric
+METRIC_CARDS = [
+    ("total_sales", "Total Sales", "3.34%", True),
+    ("total_orders", "Total Orders", "2.89%", False),
+    ("total_visitors", "Total Visitors", "8.02%", True),
+    ("in_stock", "In Stock", "Products", True),
+    ("out_of_stock", "Out of Stock", "Products", False),
+]
+METRIC_FORMATS = {
+    "total_sales": "${:,.0f}",
+    "total_orders": "{:,}",
+    "total_visitors": "{:,}",
+    "in_stock": "{}",
+    "out_of_stock": "{}",
+}
+STOCK_SUMMARY_TEMPLATE = "In Stock: {in_stock} | Out of Stock: {out_of_stock}"
+
+# Sidebar entries as (label, is_active)
+SIDEBAR_MENU_ITEMS = (
+    ("📊 Dashboard", True),
+    ("📦 Orders", False),
+    ("🏷️ Products", False),
+    ("👥 Customers", False),
+    ("📈 Reports", False),
+    ("🎫 Discounts", False),
+    ("🔗 Integrations", False),
+    ("❓ Help", False),
+    ("⚙️ Settings", False),
+)
+
+# Conversion funnel as (name, value, change, is_positive), with the label
+# text for each step formatted once here
+CONVERSION_STEPS = (
+    ("Product Views", 25000, 9, True),
+    ("Add to Cart", 12000, 6, True),
+    ("Proceed to Checkout", 8500, 4, True),
+    ("Completed Purchases", 6200, 7, True),
+    ("Abandoned Carts", 3000, 5, False),
+)
+CONVERSION_STEP_LABELS = tuple(
+    (
+        name,
+        f"{value:,}",
+        f"{'↑' if is_positive else '↓'} {change}%",
+        is_positive,
+    )
+    for name, value, change, is_positive in CONVERSION_STEPS
+)
+
+# Chart palette; the category pie cycles through the first four as QColors
+# and the traffic legend uses a swatch stylesheet per colour, both built once
+# here instead of per slice or legend row
+CHART_COLORS = ["#FF8C00", "#4CAF50", "#2196F3", "#E91E63", "#9C27B0"]
+CATEGORY_SLICE_COLORS = [QColor(color) for color in CHART_COLORS[:4]]
+LEGEND_SWATCH_STYLES = [f"background-color: {color}; border-radius: 2px;" for color in CHART_COLORS]
+
+# Inventory status column, keyed by "is in stock"
+STOCK_STATUS_TEXT = {True: "✅ In Stock", False: "❌ Out of Stock"}
+STOCK_STATUS_BRUSHES = {True: QBrush(QColor("#22c55e")), False: QBrush(QColor("#ef4444"))}
+
+
+@contextmanager
+def updates_suspended(widget):
+    """Hold back a widget's repaints during a batch of changes and repaint once after"""
+    # Nested batches leave re-enabling to the outermost one
+    was_enabled = widget.updatesEnabled()
+    widget.setUpdatesEnabled(False)
+    try:
+        yield widget
+    finally:
+        if was_enabled:
+            widget.setUpdatesEnabled(True)
 
 
 class DatabaseManager:
@@ -92,6 +306,9 @@ class DatabaseManager:
             conn.close()
             return
         
+        # Only needed to generate the first-run sample orders
+        import random
+        
         # Sample products
         products = [
             # Electronics
@@ -180,6 +397,11 @@ class DatabaseManager:
         conn.commit()
         conn.close()
     
+    def get_version(self):
+        """Cheap change marker for the database file, without opening a connection"""
+        stat = os.stat(self.db_name)
+        return stat.st_mtime_ns, stat.st_size
+    
     def get_total_sales(self):
         """Get total sales amount"""
         conn = sqlite3.connect(self.db_name)
@@ -225,6 +447,40 @@ class DatabaseManager:
         conn.close()
         return result
     
+    def get_dashboard_metrics(self):
+        """Get the headline numbers shown in the metric cards in a single query"""
+        conn = sqlite3.connect(self.db_name)
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT
+                (SELECT COALESCE(SUM(total_amount), 0) FROM orders WHERE status = 'Completed'),
+                (SELECT COUNT(*) FROM orders),
+                (SELECT COALESCE(SUM(visitors), 0) FROM analytics),
+                (SELECT COUNT(*) FROM products WHERE stock > 0),
+                (SELECT COUNT(*) FROM products WHERE stock = 0)
+        """)
+        total_sales, total_orders, total_visitors, in_stock, out_of_stock = cursor.fetchone()
+        conn.close()
+        return {
+            "total_sales": total_sales,
+            "total_orders": total_orders,
+            "total_visitors": total_visitors,
+            "in_stock": in_stock,
+            "out_of_stock": out_of_stock,
+        }
+    
+    def get_products(self, limit=-1, offset=0):
+        """Get products for the inventory table (a negative limit returns all rows)"""
+        conn = sqlite3.connect(self.db_name)
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT name, category, price, stock, sold FROM products ORDER BY category, name LIMIT ? OFFSET ?",
+            (limit, offset)
+        )
+        results = cursor.fetchall()
+        conn.close()
+        return results
+    
     def get_revenue_data(self):
         """Get revenue and orders data for chart"""
         conn = sqlite3.connect(self.db_name)
@@ -279,37 +535,64 @@ class DatabaseManager:
 class MetricCard(QFrame):
     """Custom widget for displaying metric cards"""
     
+    # Set once on the parent container rather than on every card and label;
+    # labels are matched by object name, the change colour by property
+    STYLE = """
+        QFrame#metricCard, QFrame#metricCard QLabel {
+            background-color: white;
+            border-radius: 12px;
+            padding: 20px;
+        }
+        QLabel#metricTitle {
+            color: #666;
+            font-size: 13px;
+        }
+        QLabel#metricValue {
+            color: #333;
+            font-size: 28px;
+            font-weight: bold;
+        }
+        QLabel#metricChange {
+            color: #ef4444;
+            font-size: 12px;
+            font-weight: 600;
+        }
+        QLabel#metricChange[positive="true"] {
+            color: #22c55e;
+        }
+    """
+    
     def __init__(self, title, value, change, is_positive=True):
         super().__init__()
+        self.setObjectName("metricCard")
         self.setFrameStyle(QFrame.Shape.StyledPanel)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
         
         layout = QVBoxLayout()
         
         # Title
         title_label = QLabel(title)
-        title_label.setStyleSheet("color: #666; font-size: 13px;")
+        title_label.setObjectName("metricTitle")
         layout.addWidget(title_label)
         
         # Value
-        value_label = QLabel(value)
-        value_label.setStyleSheet("color: #333; font-size: 28px; font-weight: bold;")
-        layout.addWidget(value_label)
+        self.value_label = QLabel(value)
+        self.value_label.setObjectName("metricValue")
+        # Updated on refresh; plain text skips Qt's rich-text detection
+        self.value_label.setTextFormat(Qt.TextFormat.PlainText)
+        layout.addWidget(self.value_label)
         
         # Change percentage
-        color = "#22c55e" if is_positive else "#ef4444"
         arrow = "↑" if is_positive else "↓"
         change_label = QLabel(f"{arrow} {change}")
-        change_label.setStyleSheet(f"color: {color}; font-size: 12px; font-weight: 600;")
+        change_label.setObjectName("metricChange")
+        change_label.setProperty("positive", is_positive)
         layout.addWidget(change_label)
         
         self.setLayout(layout)
+    
+    def set_value(self, value):
+        """Update the displayed value"""
+        self.value_label.setText(value)
 
 
 class CircularProgress(QWidget):
@@ -320,29 +603,175 @@ class CircularProgress(QWidget):
         self.percentage = percentage
         self.size = size
         self.setFixedSize(size, size)
+        # Built once here rather than on every paintEvent; the static text
+        # keeps its laid-out glyphs so repaints only draw them
+        self.track_pen = QPen(QColor("#f0f0f0"), 15)
+        self.progress_pen = QPen(QColor("#FF8C00"), 15)
+        self.progress_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        self.text_color = QColor("#333")
+        self.text_font = QFont("Arial", 32, QFont.Weight.Bold)
+        self.text = QStaticText(f"{percentage}%")
+        self.text.prepare(font=self.text_font)
     
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Background circle
-        pen = QPen(QColor("#f0f0f0"), 15)
-        painter.setPen(pen)
+        painter.setPen(self.track_pen)
         rect = self.rect().adjusted(15, 15, -15, -15)
         painter.drawArc(rect, 0, 360 * 16)
         
         # Progress arc
-        pen = QPen(QColor("#FF8C00"), 15)
-        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-        painter.setPen(pen)
+        painter.setPen(self.progress_pen)
         angle = int(self.percentage * 360 / 100 * 16)
         painter.drawArc(rect, 90 * 16, -angle)
         
         # Center text
-        painter.setPen(QColor("#333"))
-        font = QFont("Arial", 32, QFont.Weight.Bold)
-        painter.setFont(font)
-        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, f"{self.percentage}%")
+        painter.setPen(self.text_color)
+        painter.setFont(self.text_font)
+        text_size = self.text.size()
+        center = QPointF(rect.center())
+        painter.drawStaticText(
+            QPointF(center.x() - text_size.width() / 2, center.y() - text_size.height() / 2),
+            self.text
+        )
+
+
+class InventoryTableModel(QAbstractTableModel):
+    """Table model for the inventory management section"""
+    
+    HEADERS = ["Product", "Category", "Price", "Stock", "Sold", "Status"]
+    COLUMN_WIDTHS = [220, 200, 100, 80, 80, 140]
+    PAGE_SIZE = 100
+    
+    def __init__(self, fetch_products):
+        super().__init__()
+        # fetch_products(limit, offset) returns the next page of product rows;
+        # the view pulls pages through canFetchMore/fetchMore as it scrolls
+        self.fetch_products = fetch_products
+        self.products = []
+        # Display strings per row, formatted once when a row is loaded or
+        # changes instead of on every data() call during painting
+        self.display_rows = []
+        self.all_fetched = False
+    
+    @staticmethod
+    def format_row(product):
+        """Format a product row into the strings shown in each column"""
+        name, category, price, stock, sold = product
+        return (name, category, f"${price:.2f}", str(stock), str(sold), STOCK_STATUS_TEXT[stock > 0])
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.products)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.display_rows[row][column]
+        
+        if role == Qt.ItemDataRole.ForegroundRole and column == 5:
+            return STOCK_STATUS_BRUSHES[self.products[row][3] > 0]
+        
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.all_fetched
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.all_fetched:
+            return
+        
+        page = self.fetch_products(self.PAGE_SIZE, len(self.products))
+        if len(page) < self.PAGE_SIZE:
+            self.all_fetched = True
+        if not page:
+            return
+        
+        first = len(self.products)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self.products.extend(page)
+        self.display_rows.extend(map(self.format_row, page))
+        self.endInsertRows()
+    
+    def update_product(self, row, product):
+        """Replace one row in place and emit a single dataChanged for it"""
+        self.products[row] = product
+        self.display_rows[row] = self.format_row(product)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+    
+    def apply_refresh(self, fresh):
+        """Apply re-read rows, emitting dataChanged only for rows that changed"""
+        # fresh comes from fetch_products(len(self.products) + 1, 0); the
+        # extra row tells us whether products were added past the end
+        loaded = len(self.products)
+        grew = len(fresh) > loaded
+        fresh = fresh[:loaded]
+        
+        # Rows inserted, removed or reordered before the end: fall back to a
+        # single reset
+        if any(old[:2] != new[:2] for old, new in zip(self.products, fresh)):
+            self.beginResetModel()
+            self.products = fresh
+            self.display_rows = list(map(self.format_row, fresh))
+            self.all_fetched = not grew
+            self.endResetModel()
+            return
+        
+        for row, (old, new) in enumerate(zip(self.products, fresh)):
+            if old != new:
+                self.update_product(row, new)
+        
+        # Rows dropped off or added at the end only touch the tail
+        if len(fresh) < loaded:
+            self.beginRemoveRows(QModelIndex(), len(fresh), loaded - 1)
+            del self.products[len(fresh):]
+            del self.display_rows[len(fresh):]
+            self.endRemoveRows()
+            self.all_fetched = True
+        elif grew and self.all_fetched:
+            self.all_fetched = False
+            self.fetchMore()
+
+
+class RefreshSignals(QObject):
+    """Signals emitted by DashboardRefreshWorker"""
+    
+    finished = pyqtSignal(int, list, dict)
+    failed = pyqtSignal(str)
+
+
+class DashboardRefreshWorker(QRunnable):
+    """Re-reads the metrics and loaded inventory rows off the GUI thread"""
+    
+    def __init__(self, db, loaded):
+        super().__init__()
+        self.db = db
+        self.loaded = loaded
+        self.signals = RefreshSignals()
+    
+    def run(self):
+        # DatabaseManager opens a connection per call, so this is thread safe
+        try:
+            products = self.db.get_products(self.loaded + 1, 0)
+            metrics = self.db.get_dashboard_metrics()
+        except sqlite3.Error as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(self.loaded, products, metrics)
 
 
 class EzMartDashboard(QMainWindow):
@@ -351,6 +780,9 @@ class EzMartDashboard(QMainWindow):
     def __init__(self):
         super().__init__()
         self.db = DatabaseManager()
+        self.db_version = self.db.get_version()
+        self.metrics = self.db.get_dashboard_metrics()
+        self.refresh_in_flight = False
         self.init_ui()
         self.setup_refresh_timer()
     
@@ -358,7 +790,6 @@ class EzMartDashboard(QMainWindow):
         """Initialize the user interface"""
         self.setWindowTitle("EzMart - E-Commerce Analytics Dashboard")
         self.setGeometry(100, 100, 1600, 900)
-        self.setStyleSheet("background-color: #f5f5f5;")
         
         # Main widget and layout
         main_widget = QWidget()
@@ -373,7 +804,7 @@ class EzMartDashboard(QMainWindow):
         # Main content area
         content_scroll = QScrollArea()
         content_scroll.setWidgetResizable(True)
-        content_scroll.setStyleSheet("QScrollArea { border: none; }")
+        content_scroll.setObjectName("content")
         
         content_widget = QWidget()
         content_layout = QVBoxLayout()
@@ -447,30 +878,7 @@ class EzMartDashboard(QMainWindow):
         """Create navigation sidebar"""
         sidebar = QFrame()
         sidebar.setFixedWidth(250)
-        sidebar.setStyleSheet("""
-            QFrame {
-                background-color: #1a1a2e;
-                color: white;
-            }
-            QPushButton {
-                text-align: left;
-                padding: 15px 20px;
-                border: none;
-                color: #b4b4b4;
-                font-size: 14px;
-                background-color: transparent;
-            }
-            QPushButton:hover {
-                background-color: #252542;
-                color: white;
-            }
-            QPushButton#active {
-                background-color: #FF8C00;
-                color: white;
-                border-radius: 10px;
-                margin: 0 10px;
-            }
-        """)
+        sidebar.setObjectName("sidebar")
         
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -482,19 +890,7 @@ class EzMartDashboard(QMainWindow):
         layout.addWidget(logo)
         
         # Menu items
-        menu_items = [
-            ("📊 Dashboard", True),
-            ("📦 Orders", False),
-            ("🏷️ Products", False),
-            ("👥 Customers", False),
-            ("📈 Reports", False),
-            ("🎫 Discounts", False),
-            ("🔗 Integrations", False),
-            ("❓ Help", False),
-            ("⚙️ Settings", False),
-        ]
-        
-        for item, is_active in menu_items:
+        for item, is_active in SIDEBAR_MENU_ITEMS:
             btn = QPushButton(item)
             if is_active:
                 btn.setObjectName("active")
@@ -507,7 +903,7 @@ class EzMartDashboard(QMainWindow):
     def create_header(self):
         """Create header bar"""
         header = QFrame()
-        header.setStyleSheet("background-color: white; border-radius: 12px; padding: 15px;")
+        header.setObjectName("header")
         header.setFixedHeight(80)
         
         layout = QHBoxLayout()
@@ -515,15 +911,7 @@ class EzMartDashboard(QMainWindow):
         # Search bar
         search = QLineEdit()
         search.setPlaceholderText("🔍 Search stock, order, etc")
-        search.setStyleSheet("""
-            QLineEdit {
-                padding: 10px 15px;
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-                font-size: 14px;
-                background-color: #f9f9f9;
-            }
-        """)
+        search.setObjectName("search")
         search.setFixedWidth(400)
         layout.addWidget(search)
         
@@ -531,18 +919,7 @@ class EzMartDashboard(QMainWindow):
         
         # Notifications
         notif_btn = QPushButton("🔔")
-        notif_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f9f9f9;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 15px;
-                font-size: 18px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-        """)
+        notif_btn.setObjectName("notifications")
         layout.addWidget(notif_btn)
         
         # Profile
@@ -556,28 +933,18 @@ class EzMartDashboard(QMainWindow):
     def create_metric_cards(self):
         """Create top metric cards"""
         container = QWidget()
+        container.setStyleSheet(MetricCard.STYLE)
         layout = QHBoxLayout()
         layout.setSpacing(20)
         
-        # Get data from database
-        total_sales = self.db.get_total_sales()
-        total_orders = self.db.get_total_orders()
-        total_visitors = self.db.get_total_visitors()
-        in_stock = self.db.get_in_stock_count()
-        out_of_stock = self.db.get_out_of_stock_count()
-        
-        # Create cards
-        card1 = MetricCard("Total Sales", f"${total_sales:,.0f}", "3.34%", True)
-        card2 = MetricCard("Total Orders", f"{total_orders:,}", "2.89%", False)
-        card3 = MetricCard("Total Visitors", f"{total_visitors:,}", "8.02%", True)
-        card4 = MetricCard("In Stock", f"{in_stock}", "Products", True)
-        card5 = MetricCard("Out of Stock", f"{out_of_stock}", "Products", False)
-        
-        layout.addWidget(card1)
-        layout.addWidget(card2)
-        layout.addWidget(card3)
-        layout.addWidget(card4)
-        layout.addWidget(card5)
+        # Create cards, keeping them by metric so refresh can update the
+        # value labels directly
+        self.metric_cards = {}
+        for key, title, change, is_positive in METRIC_CARDS:
+            value = METRIC_FORMATS[key].format(self.metrics[key])
+            card = MetricCard(title, value, change, is_positive)
+            self.metric_cards[key] = card
+            layout.addWidget(card)
         
         container.setLayout(layout)
         return container
@@ -585,12 +952,12 @@ class EzMartDashboard(QMainWindow):
     def create_revenue_chart(self):
         """Create revenue analytics line chart"""
         frame = QFrame()
-        frame.setStyleSheet("background-color: white; border-radius: 12px; padding: 20px;")
+        frame.setObjectName("card")
         
         layout = QVBoxLayout()
         
         title = QLabel("Revenue Analytics")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; color: #333;")
+        title.setObjectName("sectionTitle")
         layout.addWidget(title)
         
         # Create chart
@@ -610,12 +977,9 @@ class EzMartDashboard(QMainWindow):
         orders_series = QLineSeries()
         orders_series.setName("Orders")
         
-        categories = []
-        for i, (date, revenue, orders) in enumerate(revenue_data):
+        for i, (_, revenue, orders) in enumerate(revenue_data):
             revenue_series.append(i, revenue)
             orders_series.append(i, orders)
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
-            categories.append(date_obj.strftime("%b %d"))
         
         chart.addSeries(revenue_series)
         chart.addSeries(orders_series)
@@ -645,13 +1009,13 @@ class EzMartDashboard(QMainWindow):
     def create_monthly_target(self):
         """Create monthly target progress widget"""
         frame = QFrame()
-        frame.setStyleSheet("background-color: white; border-radius: 12px; padding: 20px;")
+        frame.setObjectName("card")
         
         layout = QVBoxLayout()
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         title = QLabel("Monthly Target")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; color: #333;")
+        title.setObjectName("sectionTitle")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
@@ -701,12 +1065,12 @@ class EzMartDashboard(QMainWindow):
     def create_categories_chart(self):
         """Create top categories pie chart"""
         frame = QFrame()
-        frame.setStyleSheet("background-color: white; border-radius: 12px; padding: 20px;")
+        frame.setObjectName("card")
         
         layout = QVBoxLayout()
         
         title = QLabel("Top Categories")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; color: #333;")
+        title.setObjectName("sectionTitle")
         layout.addWidget(title)
         
         # Create pie chart
@@ -714,11 +1078,10 @@ class EzMartDashboard(QMainWindow):
         
         # Get data
         categories = self.db.get_category_sales()
-        colors = ["#FF8C00", "#4CAF50", "#2196F3", "#E91E63"]
         
         for i, (category, sales) in enumerate(categories):
             slice = series.append(f"{category}\n${sales:,.0f}", sales)
-            slice.setColor(QColor(colors[i % len(colors)]))
+            slice.setColor(CATEGORY_SLICE_COLORS[i % len(CATEGORY_SLICE_COLORS)])
         
         chart = QChart()
         chart.addSeries(series)
@@ -737,14 +1100,14 @@ class EzMartDashboard(QMainWindow):
     def create_active_users(self):
         """Create active users by country widget"""
         frame = QFrame()
-        frame.setStyleSheet("background-color: white; border-radius: 12px; padding: 20px;")
+        frame.setObjectName("card")
         
         layout = QVBoxLayout()
         
         # Header
         header_layout = QHBoxLayout()
         title = QLabel("Active Users")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; color: #333;")
+        title.setObjectName("sectionTitle")
         header_layout.addWidget(title)
         
         count = QLabel("2,758")
@@ -766,11 +1129,11 @@ class EzMartDashboard(QMainWindow):
             
             country_header = QHBoxLayout()
             country_label = QLabel(country)
-            country_label.setStyleSheet("font-size: 13px; color: #333;")
+            country_label.setObjectName("countryName")
             country_header.addWidget(country_label)
             country_header.addStretch()
             percent_label = QLabel(f"{percentage:.1f}%")
-            percent_label.setStyleSheet("font-size: 12px; color: #666;")
+            percent_label.setObjectName("countryPercent")
             country_header.addWidget(percent_label)
             country_layout.addLayout(country_header)
             
@@ -778,18 +1141,7 @@ class EzMartDashboard(QMainWindow):
             progress.setValue(int(percentage))
             progress.setMaximum(100)
             progress.setTextVisible(False)
-            progress.setStyleSheet("""
-                QProgressBar {
-                    border: none;
-                    border-radius: 4px;
-                    background-color: #f0f0f0;
-                    height: 8px;
-                }
-                QProgressBar::chunk {
-                    background-color: #FF8C00;
-                    border-radius: 4px;
-                }
-            """)
+            progress.setObjectName("countryProgress")
             country_layout.addWidget(progress)
             layout.addLayout(country_layout)
         
@@ -800,51 +1152,36 @@ class EzMartDashboard(QMainWindow):
     def create_conversion_rate(self):
         """Create conversion rate funnel widget"""
         frame = QFrame()
-        frame.setStyleSheet("background-color: white; border-radius: 12px; padding: 20px;")
+        frame.setObjectName("card")
         
         layout = QVBoxLayout()
         
         title = QLabel("Conversion Rate")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; color: #333;")
+        title.setObjectName("sectionTitle")
         layout.addWidget(title)
         
-        # Conversion steps
-        steps = [
-            ("Product Views", 25000, 9, True),
-            ("Add to Cart", 12000, 6, True),
-            ("Proceed to Checkout", 8500, 4, True),
-            ("Completed Purchases", 6200, 7, True),
-            ("Abandoned Carts", 3000, 5, False),
-        ]
-        
         steps_layout = QHBoxLayout()
         steps_layout.setSpacing(10)
         
-        for step_name, value, change, is_positive in steps:
+        # Conversion steps
+        for step_name, value_text, change_text, is_positive in CONVERSION_STEP_LABELS:
             step_frame = QFrame()
-            step_frame.setStyleSheet("""
-                QFrame {
-                    background-color: #f9f9f9;
-                    border-radius: 8px;
-                    padding: 15px;
-                }
-            """)
+            step_frame.setObjectName("conversionStep")
             
             step_layout = QVBoxLayout()
             
             name_label = QLabel(step_name)
-            name_label.setStyleSheet("font-size: 11px; color: #666;")
+            name_label.setObjectName("stepName")
             name_label.setWordWrap(True)
             step_layout.addWidget(name_label)
             
-            value_label = QLabel(f"{value:,}")
-            value_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #333;")
+            value_label = QLabel(value_text)
+            value_label.setObjectName("stepValue")
             step_layout.addWidget(value_label)
             
-            color = "#22c55e" if is_positive else "#ef4444"
-            arrow = "↑" if is_positive else "↓"
-            change_label = QLabel(f"{arrow} {change}%")
-            change_label.setStyleSheet(f"font-size: 11px; color: {color}; font-weight: 600;")
+            change_label = QLabel(change_text)
+            change_label.setObjectName("stepChange")
+            change_label.setProperty("positive", is_positive)
             step_layout.addWidget(change_label)
             
             step_frame.setLayout(step_layout)
@@ -857,17 +1194,16 @@ class EzMartDashboard(QMainWindow):
     def create_traffic_sources(self):
         """Create traffic sources widget"""
         frame = QFrame()
-        frame.setStyleSheet("background-color: white; border-radius: 12px; padding: 20px;")
+        frame.setObjectName("card")
         
         layout = QVBoxLayout()
         
         title = QLabel("Traffic Sources")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; color: #333;")
+        title.setObjectName("sectionTitle")
         layout.addWidget(title)
         
         # Get traffic data
         traffic_data = self.db.get_traffic_sources()
-        colors = ["#FF8C00", "#4CAF50", "#2196F3", "#E91E63", "#9C27B0"]
         
         # Create horizontal stacked bar
         bar_container = QFrame()
@@ -881,17 +1217,17 @@ class EzMartDashboard(QMainWindow):
             
             color_box = QLabel()
             color_box.setFixedSize(12, 12)
-            color_box.setStyleSheet(f"background-color: {colors[i]}; border-radius: 2px;")
+            color_box.setStyleSheet(LEGEND_SWATCH_STYLES[i])
             item_layout.addWidget(color_box)
             
             source_label = QLabel(source)
-            source_label.setStyleSheet("font-size: 12px; color: #666;")
+            source_label.setObjectName("legendSource")
             item_layout.addWidget(source_label)
             
             item_layout.addStretch()
             
             percent_label = QLabel(f"{percentage}%")
-            percent_label.setStyleSheet("font-size: 12px; font-weight: bold; color: #333;")
+            percent_label.setObjectName("legendPercent")
             item_layout.addWidget(percent_label)
             
             layout.addLayout(item_layout)
@@ -903,76 +1239,43 @@ class EzMartDashboard(QMainWindow):
     def create_inventory_section(self):
         """Create inventory management section"""
         frame = QFrame()
-        frame.setStyleSheet("background-color: white; border-radius: 12px; padding: 20px;")
+        frame.setObjectName("card")
         
         layout = QVBoxLayout()
         
         # Header
         header_layout = QHBoxLayout()
         title = QLabel("📦 Inventory Management")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; color: #333;")
+        title.setObjectName("sectionTitle")
         header_layout.addWidget(title)
         header_layout.addStretch()
         
-        # Stock status
-        in_stock = self.db.get_in_stock_count()
-        out_stock = self.db.get_out_of_stock_count()
-        
-        stock_label = QLabel(f"In Stock: {in_stock} | Out of Stock: {out_stock}")
-        stock_label.setStyleSheet("font-size: 14px; color: #666;")
-        header_layout.addWidget(stock_label)
+        # Stock status (shared with the metric cards)
+        self.stock_label = QLabel(STOCK_SUMMARY_TEMPLATE.format_map(self.metrics))
+        self.stock_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.stock_label.setStyleSheet("font-size: 14px; color: #666;")
+        header_layout.addWidget(self.stock_label)
         
         layout.addLayout(header_layout)
         
-        # Products table
-        table = QTableWidget()
-        table.setColumnCount(6)
-        table.setHorizontalHeaderLabels(["Product", "Category", "Price", "Stock", "Sold", "Status"])
-        table.horizontalHeader().setStretchLastSection(True)
+        # Products table, backed by a model so a reload is one reset signal
+        # instead of a setItem() call (and itemChanged emission) per cell
+        self.inventory_model = InventoryTableModel(self.db.get_products)
+        self.inventory_model.fetchMore()
+        
+        table = QTableView()
+        table.setModel(self.inventory_model)
+        self.inventory_table = table
+        # Pinned column widths: resizing to contents would measure every
+        # loaded row (and run again as pages are fetched)
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        for column, width in enumerate(InventoryTableModel.COLUMN_WIDTHS):
+            header.resizeSection(column, width)
+        header.setStretchLastSection(True)
         table.setAlternatingRowColors(True)
-        table.setStyleSheet("""
-            QTableWidget {
-                border: none;
-                gridline-color: #e0e0e0;
-                font-size: 13px;
-            }
-            QTableWidget::item {
-                padding: 8px;
-            }
-            QHeaderView::section {
-                background-color: #f5f5f5;
-                padding: 10px;
-                border: none;
-                font-weight: bold;
-                color: #666;
-            }
-        """)
-        
-        # Get products from database
-        conn = sqlite3.connect(self.db.db_name)
-        cursor = conn.cursor()
-        cursor.execute("SELECT name, category, price, stock, sold FROM products ORDER BY category, name")
-        products = cursor.fetchall()
-        conn.close()
-        
-        table.setRowCount(len(products))
+        table.setObjectName("inventory")
         
-        for row, (name, category, price, stock, sold) in enumerate(products):
-            table.setItem(row, 0, QTableWidgetItem(name))
-            table.setItem(row, 1, QTableWidgetItem(category))
-            table.setItem(row, 2, QTableWidgetItem(f"${price:.2f}"))
-            table.setItem(row, 3, QTableWidgetItem(str(stock)))
-            table.setItem(row, 4, QTableWidgetItem(str(sold)))
-            
-            status = "✅ In Stock" if stock > 0 else "❌ Out of Stock"
-            status_item = QTableWidgetItem(status)
-            if stock == 0:
-                status_item.setForeground(QColor("#ef4444"))
-            else:
-                status_item.setForeground(QColor("#22c55e"))
-            table.setItem(row, 5, status_item)
-        
-        table.resizeColumnsToContents()
         layout.addWidget(table)
         
         frame.setLayout(layout)
@@ -980,15 +1283,76 @@ class EzMartDashboard(QMainWindow):
     
     def setup_refresh_timer(self):
         """Setup timer for auto-refresh"""
-        self.timer = QTimer()
+        self.timer = QTimer(self)
+        self.timer.setInterval(30000)  # Refresh every 30 seconds
         self.timer.timeout.connect(self.refresh_data)
-        self.timer.start(30000)  # Refresh every 30 seconds
+        # The timer is started/stopped from showEvent/hideEvent so a hidden
+        # dashboard does no background work
+    
+    def showEvent(self, event):
+        """Resume auto-refresh when the dashboard becomes visible"""
+        super().showEvent(event)
+        self.timer.start()
+    
+    def hideEvent(self, event):
+        """Pause auto-refresh while the dashboard is hidden"""
+        super().hideEvent(event)
+        self.timer.stop()
     
     def refresh_data(self):
         """Refresh dashboard data"""
-        # In a production app, this would fetch new data
-        # For demo, we'll just show the refresh is working
-        print("Dashboard data refreshed at", datetime.now().strftime("%H:%M:%S"))
+        if not self.isVisible() or self.visibleRegion().isEmpty():
+            return
+        
+        # Never queue a second fetch behind a slow one
+        if self.refresh_in_flight:
+            return
+        
+        # Skip the queries entirely when nothing has written to the database
+        db_version = self.db.get_version()
+        if db_version == self.db_version:
+            return
+        self.db_version = db_version
+        
+        self.refresh_in_flight = True
+        worker = DashboardRefreshWorker(self.db, len(self.inventory_model.products))
+        worker.signals.finished.connect(self.apply_refresh)
+        worker.signals.failed.connect(self.refresh_failed)
+        QThreadPool.globalInstance().start(worker)
+    
+    def refresh_failed(self, error):
+        """Let the next timer tick retry a refresh whose queries failed"""
+        self.refresh_in_flight = False
+        self.db_version = None
+        logger.warning("Dashboard refresh failed: %s", error)
+    
+    def apply_refresh(self, loaded, products, metrics):
+        """Apply data fetched by DashboardRefreshWorker (runs on the GUI thread)"""
+        self.refresh_in_flight = False
+        self.update_metrics(metrics)
+        
+        if loaded != len(self.inventory_model.products):
+            # The view paged in more rows meanwhile; redo the fetch next tick
+            self.db_version = None
+            return
+        
+        # A refresh can emit one dataChanged per row; repaint once at the end
+        with updates_suspended(self.inventory_table):
+            self.inventory_model.apply_refresh(products)
+        logger.debug("Dashboard data refreshed")
+    
+    def update_metrics(self, metrics):
+        """Update the metric cards and stock summary through cached label references"""
+        # Nothing to format or hand to Qt when the numbers are unchanged
+        if metrics == self.metrics:
+            return
+        previous, self.metrics = self.metrics, metrics
+        # Only the cards and summary whose inputs moved are re-set
+        for key, card in self.metric_cards.items():
+            if metrics[key] != previous[key]:
+                card.set_value(METRIC_FORMATS[key].format(metrics[key]))
+        if any(metrics[key] != previous[key] for key in ("in_stock", "out_of_stock")):
+            self.stock_label.setText(STOCK_SUMMARY_TEMPLATE.format_map(metrics))
 
 
 def main():
@@ -997,6 +1361,7 @@ def main():
     
     # Set application style
     app.setStyle("Fusion")
+    app.setStyleSheet(APP_STYLE)
     
     # Set font
     font = QFont("Segoe UI", 10)